@@ -49,7 +49,7 @@ from ..objects.app import (
     AppCommandType,
 )
 from ..utils import get_index, should_pass_ctx
-from ..utils.signature import get_signature_and_params
+from ..utils.signature import get_command_info, get_signature_and_params
 from ..utils.types import MISSING
 from ..utils.types import Singleton
 
@@ -583,6 +583,9 @@ def register_command(
         ),
     )
 
+    # Introspected now so invoking the command doesn't have to
+    get_command_info(func)
+
     _log.info(f"Registered command `{cmd}` to `{func.__name__}` locally.")
     return func
 
@@ -1,8 +1,10 @@
 # Copyright Pincer 2021-Present
 # Full MIT License can be found in `LICENSE` at the project root.
 
+from sys import intern
 from typing import Callable, Dict
 
+from ...utils.signature import get_command_info
 from ...utils.types import Singleton
 
 
@@ -17,5 +19,9 @@ class ComponentHandler(metaclass=Singleton):
 
     register: Dict[str, Callable] = {}
 
-    def register_id(self, _id: str, func: Callable):
-        self.register[_id] = func
+    @classmethod
+    def register_id(cls, _id: str, func: Callable):
+        # Interned so the key is shared with every component using the id
+        cls.register[intern(_id)] = func
+        # Introspected now so handling the interaction doesn't have to
+        get_command_info(func)
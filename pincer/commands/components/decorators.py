@@ -1,7 +1,6 @@
 # Copyright Pincer 2021-Present
 # Full MIT License can be found in `LICENSE` at the project root.
 
-from functools import partial
 from inspect import iscoroutinefunction
 from typing import List
 
@@ -24,11 +23,11 @@ def component(custom_id):
     custom_id : str
         The ID of the message component to handle.
     """
-    def wrap(custom_id, func):
-        ComponentHandler().register_id(_id=custom_id, func=func)
+    def wrap(func):
+        ComponentHandler.register_id(_id=custom_id, func=func)
         return func
 
-    return partial(wrap, custom_id)
+    return wrap
 
 
 def button(
@@ -67,21 +66,20 @@ def button(
                 return "Button one pressed"
     """  # noqa: E501
 
-    def wrap(custom_id, func) -> Button:
+    def wrap(func) -> Button:
 
         if not iscoroutinefunction(func):
             raise CommandIsNotCoroutine(f"`{func.__name__}` must be a coroutine.")
 
-        if custom_id is None:
-            custom_id = func.__name__
+        _id = func.__name__ if custom_id is None else custom_id
 
-        ComponentHandler().register_id(custom_id, func)
+        ComponentHandler.register_id(_id, func)
 
         button = Button(
             # Hack to not override defaults in button class
             **remove_none(
                 {
-                    "custom_id": custom_id,
+                    "custom_id": _id,
                     "style": style,
                     "label": label,
                     "disabled": disabled,
@@ -93,11 +91,10 @@ def button(
         )
 
         button.func = func
-        button.__call__ = partial(func)
 
         return button
 
-    return partial(wrap, custom_id)
+    return wrap
 
 
 def select_menu(
@@ -141,21 +138,20 @@ def select_menu(
 
     """  # noqa: E501
 
-    def wrap(custom_id, func) -> SelectMenu:
+    def wrap(func) -> SelectMenu:
 
         if not iscoroutinefunction(func):
             raise CommandIsNotCoroutine(f"`{func.__name__}` must be a coroutine.")
 
-        if custom_id is None:
-            custom_id = func.__name__
+        _id = func.__name__ if custom_id is None else custom_id
 
-        ComponentHandler().register_id(custom_id, func)
+        ComponentHandler.register_id(_id, func)
 
         menu = SelectMenu(
             # Hack to not override defaults in button class
             **remove_none(
                 {
-                    "custom_id": custom_id,
+                    "custom_id": _id,
                     "options": options,
                     "placeholder": placeholder,
                     "min_values": min_values,
@@ -169,6 +165,6 @@ def select_menu(
         return menu
 
     if func is None:
-        return partial(wrap, custom_id)
+        return wrap
 
-    return wrap(custom_id, func)
+    return wrap(func)
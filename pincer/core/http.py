@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import logging
-from asyncio import sleep
-from json import dumps
+from asyncio import (
+    CancelledError, Future, ensure_future, get_running_loop, shield, sleep
+)
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from random import uniform
+from time import monotonic
+from urllib.parse import urlencode
 from typing import Protocol, TYPE_CHECKING
 
-from aiohttp import ClientSession, ClientResponse
+from aiohttp import BytesPayload, ClientSession, ClientResponse, TCPConnector
 
 # I'm open for ideas on how to get __version__ without doing this
 import pincer
@@ -19,18 +26,37 @@ from ..exceptions import (
     ForbiddenError, MethodNotAllowedError, RateLimitError, ServerError,
     HTTPError
 )
-from ..utils.conversion import remove_none
+from ..utils.conversion import json_dumps, remove_none
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Optional, Union
+    from typing import Any, Dict, Optional, Tuple, Type, Union
 
     from aiohttp.client import _RequestContextManager
     from aiohttp.payload import Payload
     from aiohttp.typedefs import StrOrURL
 
 
+def _json_serialize(obj: Any) -> str:
+    """JSON serializer for aiohttp, which expects a string."""
+    return json_dumps(obj).decode()
+
+
 _log = logging.getLogger(__package__)
 
+# Bounds in seconds of the decorrelated jitter backoff between retries
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+# Max amount of cached GET responses, the oldest one is dropped first
+_GET_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=1)
+def _user_agent() -> str:
+    # ``pincer.__version__`` only exists once the package finished
+    # importing, so this can't be a module level constant.
+    return f"DiscordBot (https://github.com/Pincer-org/Pincer, {pincer.__version__})"  # noqa: E501
+
 
 class HttpCallable(Protocol):
     """Aiohttp HTTP method."""
@@ -45,6 +71,95 @@ class HttpCallable(Protocol):
         ...
 
 
+@dataclass
+class _Retry:
+    """Tells ``HTTPClient.__send`` to send a request again.
+
+    Attributes
+    ----------
+    rate_limited: :class:`bool`
+        Whether the request got a 429 instead of a 5xx error code.
+    timeout: Optional[:class:`float`]
+        The ``retry_after`` Discord sent along with a 429.
+        |default| :data:`None`
+    """
+    rate_limited: bool
+    timeout: Optional[float] = None
+
+
+@dataclass
+class _InflightGet:
+    """A GET request which other callers of the same route can await.
+
+    Attributes
+    ----------
+    future: :class:`asyncio.Future`
+        Gets the response, or the error, of the request once the caller
+        which sent it received it.
+    waiters: :class:`int`
+        Amount of callers that joined the request after it was sent.
+        |default| ``0``
+    """
+    future: Future
+    waiters: int = 0
+
+
+@dataclass
+class _RouteGeneration:
+    """Tracks the changes made to a route while GETs of it are sent.
+
+    Attributes
+    ----------
+    generation: :class:`int`
+        Amount of times the route got changed since the first of its
+        GETs was sent.
+        |default| ``0``
+    gets: :class:`int`
+        Amount of GETs of the route which are being sent.
+        |default| ``0``
+    """
+    generation: int = 0
+    gets: int = 0
+
+
+def _copy_exception(error: Exception) -> Exception:
+    """Create a new exception with the type and arguments of another one.
+
+    Parameters
+    ----------
+    error: :class:`Exception`
+        The exception to copy.
+
+    Returns
+    -------
+    :class:`Exception`
+        The copy, or ``error`` itself when its type can't be created from
+        its arguments.
+    """
+    try:
+        return type(error)(*error.args)
+    except Exception:
+        return error
+
+
+def _copy_outcome(future: Future, task: Future):
+    """Give a future the result, error or cancellation of a finished task.
+
+    Parameters
+    ----------
+    future: :class:`asyncio.Future`
+        The future to set.
+    task: :class:`asyncio.Future`
+        The finished task.
+    """
+    if task.cancelled():
+        future.cancel()
+    elif (error := task.exception()) is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(task.result())
+
+
 class HTTPClient:
     """Interacts with Discord API through HTTP protocol
 
@@ -62,6 +177,18 @@ class HTTPClient:
         See `<https://discord.com/developers/docs/reference#api-versioning>`_.
     ttl:
         Max amount of attempts after error code 5xx
+    cache_ttls:
+        Seconds to cache GET responses for, per route. Ids in the routes
+        are written as ``{id}``, e.g. ``{"users/@me": 60, "guilds/{id}": 30}``,
+        and without a leading slash.
+        Nothing gets cached by default. A successful request with any other
+        method removes the cached responses of its route and of the routes
+        above and below it. Changes made elsewhere are only seen once the
+        time runs out.
+    session:
+        An aiohttp session to send the requests with, which can be shared
+        between clients. It won't be closed by :meth:`close`. One gets
+        created on the first request when no session is given.
 
     Attributes
     ----------
@@ -70,30 +197,70 @@ class HTTPClient:
         "Base url for all HTTP requests"
     max_tts: :class:`int`
         Max amount of attempts after error code 5xx
+    cache_ttls: Dict[:class:`str`, :class:`float`]
+        Seconds to cache GET responses for, per route.
     """
 
-    def __init__(self, token: str, *, version: int = None, ttl: int = 5):
+    def __init__(
+            self,
+            token: str, *,
+            version: int = None,
+            ttl: int = 5,
+            cache_ttls: Optional[Dict[str, float]] = None,
+            session: Optional[ClientSession] = None
+    ):
         version = version or GatewayConfig.version
-        self.url: str = f"https://discord.com/api/v{version}"
+        self.url = f"https://discord.com/api/v{version}"
         self.max_ttl: int = ttl
+        self.cache_ttls: Dict[str, float] = cache_ttls or {}
 
-        headers: Dict[str, str] = {
+        self.__headers: Dict[str, str] = {
             "Authorization": f"Bot {token}",
-            "User-Agent": f"DiscordBot (https://github.com/Pincer-org/Pincer, {pincer.__version__})"  # noqa: E501
+            "User-Agent": _user_agent()
+        }
+        # A session that isn't ours doesn't send our headers by default,
+        # so they have to be added to every request.
+        self.__request_headers: Dict[str, str] = (
+            {} if session is None else self.__headers
+        )
+        # Shared by every json request without extra headers
+        self.__json_headers: Dict[str, str] = {
+            **self.__request_headers,
+            "Content-Type": "application/json"
         }
+
         self.__rate_limiter = RateLimiter()
-        self.__session: ClientSession = ClientSession(headers=headers)
-
-        self.__http_exceptions: Dict[int, HTTPError] = {
-            304: NotModifiedError(),
-            400: BadRequestError(),
-            401: UnauthorizedError(),
-            403: ForbiddenError(),
-            404: NotFoundError(),
-            405: MethodNotAllowedError(),
-            429: RateLimitError()
+        self.__inflight_gets: Dict[Tuple[str, str], _InflightGet] = {}
+        self.__get_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self.__route_generations: Dict[str, _RouteGeneration] = {}
+
+        self.__owns_session: bool = session is None
+        self.__session: Optional[ClientSession] = None
+        self.__methods: Dict[str, HttpCallable] = {}
+
+        if session is not None:
+            self.__bind_session(session)
+
+        self.__http_exceptions: Dict[int, Type[HTTPError]] = {
+            304: NotModifiedError,
+            400: BadRequestError,
+            401: UnauthorizedError,
+            403: ForbiddenError,
+            404: NotFoundError,
+            405: MethodNotAllowedError,
+            429: RateLimitError
         }
 
+    @property
+    def url(self) -> str:
+        return self.__url
+
+    @url.setter
+    def url(self, url: str):
+        self.__url = url
+        # Joined with the endpoint on every request
+        self.__url_prefix = url + "/"
+
     # for with block
     async def __aenter__(self):
         return self
@@ -104,27 +271,80 @@ class HTTPClient:
     async def close(self):
         """|coro|
 
-        Closes the aiohttp session
+        Closes the aiohttp session, unless it was passed to the client.
         """
-        await self.__session.close()
+        if self.__owns_session and self.__session is not None:
+            await self.__session.close()
+
+    def __bind_session(self, session: ClientSession):
+        """Use a session for all requests.
+
+        Parameters
+        ----------
+        session: :class:`aiohttp.ClientSession`
+            The session to send the requests with.
+        """
+        self.__session = session
+
+        # Bound once so requests don't look the verbs up on the session
+        self.__methods = {
+            "DELETE": session.delete,
+            "GET": session.get,
+            "HEAD": session.head,
+            "OPTIONS": session.options,
+            "PATCH": session.patch,
+            "POST": session.post,
+            "PUT": session.put,
+        }
+
+    def __create_session(self):
+        """Create the session of the client. This has to happen inside the
+        running event loop, so it's done on the first request.
+        """
+        # Every request goes to discord.com, so the per host limit is the
+        # one that matters. It matches Discord's global rate limit of
+        # 50 requests per second. Connections and DNS lookups are kept
+        # around for longer than aiohttp's defaults to skip new handshakes.
+        connector = TCPConnector(
+            limit_per_host=50,
+            ttl_dns_cache=300,
+            keepalive_timeout=75
+        )
+        self.__bind_session(
+            ClientSession(
+                headers=self.__headers,
+                connector=connector,
+                json_serialize=_json_serialize
+            )
+        )
 
     async def __send(
             self,
-            method: HttpCallable,
+            method: str,
             endpoint: str, *,
             content_type: str = "application/json",
-            data: Optional[Union[Dict, str, Payload]] = None,
+            data: Optional[Union[Dict, str, bytes, Payload]] = None,
             headers: Optional[Dict[str, Any]] = None,
-            _ttl: Optional[int] = None,
             params: Optional[Dict] = None,
     ) -> Optional[Dict]:
         """
         Send an api request to the Discord REST API.
 
+        Side effects:
+            If a 429 error code is returned it will wait for the rate limit
+            to end and retry the request.
+            If a 5xx error code is returned it will retry the request, at
+            most ``max_ttl`` attempts are made.
+
+        Retries that don't get a ``retry_after`` from Discord back off with
+        decorrelated jitter: each sleep is a random duration between 1s and
+        three times the previous sleep, capped at 30s. This keeps concurrent
+        requests from retrying in lockstep during an outage.
+
         Parameters
         ----------
 
-        method: :class:`aiohttp.ClientSession.request`
+        method: :class:`str`
             The method for the request. (e.g. GET or POST)
 
         endpoint: :class:`str`
@@ -133,8 +353,10 @@ class HTTPClient:
         content_type: :class:`str`
             The request's content type.
 
-        data: Optional[Union[:class:`Dict`, :class:`str`, :class:`aiohttp.payload.Payload`]]
+        data: Optional[Union[:class:`Dict`, :class:`str`, :class:`bytes`, :class:`aiohttp.payload.Payload`]]
             The data which will be added to the request.
+            Dictionaries get encoded to JSON, using ``orjson`` when
+            it is installed.
             |default| :data:`None`
 
         headers: Optional[:class:`Dict`]
@@ -145,63 +367,104 @@ class HTTPClient:
             The query parameters to add to the request.
             |default| :data:`None`
 
-        _ttl: Optional[:class:`int`]
-            Private param used for recursively setting the retry amount.
-            (Eg set to 1 for 1 max retry)
-            |default| :data:`None`
+        Raises
+        ------
+        :class:`~pincer.exceptions.ServerError`
+            The maximum amount of attempts has been reached.
         """
-        ttl = _ttl or self.max_ttl
+        # TODO: Adjust to work non-json types
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("%s %s | %s", method, endpoint, data)
 
-        if ttl == 0:
-            logging.error(
-                # TODO: print better method name
-                f"{method.__name__.upper()} {endpoint} has reached the "
-                f"maximum retry count of {self.max_ttl}."
+        if isinstance(data, dict):
+            # Encoded once, retries reuse the same payload
+            data = BytesPayload(json_dumps(data))
+
+        if headers is None and content_type == "application/json":
+            req_headers = self.__json_headers
+        else:
+            req_headers = {
+                **self.__request_headers,
+                "Content-Type": content_type,
+                **(remove_none(headers) or {})
+            }
+
+        req_params = remove_none(params) if params else None
+        url = self.__url_prefix + endpoint
+        ttl = self.max_ttl
+        backoff = _BACKOFF_BASE
+
+        if self.__session is None:
+            self.__create_session()
+
+        http_method = self.__methods[method]
+
+        while ttl > 0:
+            semaphore = await self.__rate_limiter.wait_until_not_ratelimited(
+                endpoint,
+                http_method
             )
 
-            raise ServerError(f"Maximum amount of retries for `{endpoint}`.")
-
-        if isinstance(data, dict):
-            data = dumps(data)
+            try:
+                async with http_method(
+                        url,
+                        data=data,
+                        headers=req_headers,
+                        params=req_params
+                ) as res:
+                    result = await self.__handle_response(
+                        res, http_method, endpoint
+                    )
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+
+            if not isinstance(result, _Retry):
+                if method != "GET" and (
+                        self.__get_cache or self.__route_generations
+                ):
+                    self.__invalidate_cache(endpoint.lstrip("/"))
+
+                return result
+
+            if result.rate_limited and result.timeout:
+                await sleep(result.timeout)
+                continue
+
+            backoff = min(_BACKOFF_CAP, uniform(_BACKOFF_BASE, backoff * 3))
+
+            if result.rate_limited:
+                await sleep(backoff)
+                continue
+
+            ttl -= 1
+
+            if ttl:
+                _log.debug(
+                    "Server side error occurred with status code %s. "
+                    "Retrying in %.2fs.",
+                    res.status,
+                    backoff
+                )
 
-        # TODO: print better method name
-        # TODO: Adjust to work non-json types
-        _log.debug(f"{method.__name__.upper()} {endpoint} | {data}")
+                await sleep(backoff)
 
-        await self.__rate_limiter.wait_until_not_ratelimited(
-            endpoint,
-            method
+        logging.error(
+            f"{method} {endpoint} has reached the "
+            f"maximum retry count of {self.max_ttl}."
         )
 
-        url = f"{self.url}/{endpoint}"
-        async with method(
-                url,
-                data=data,
-                headers={
-                    "Content-Type": content_type,
-                    **(remove_none(headers) or {})
-                },
-                params=remove_none(params)
-        ) as res:
-            return await self.__handle_response(
-                res, method, endpoint, content_type, data, ttl
-            )
+        raise ServerError(f"Maximum amount of retries for `{endpoint}`.")
 
     async def __handle_response(
             self,
             res: ClientResponse,
             method: HttpCallable,
             endpoint: str,
-            content_type: str,
-            data: Optional[str],
-            _ttl: int,
-    ) -> Optional[Dict]:
+    ) -> Union[Optional[Dict], _Retry]:
         """
         Handle responses from the discord API.
 
-        Side effects:
-            If a 5xx error code is returned it will retry the request.
-
         Parameters
         ----------
 
@@ -214,17 +477,17 @@ class HTTPClient:
         endpoint: :class:`str`
             The endpoint to which the request was sent.
 
-        content_type: :class:`str`
-            The request's content type.
-
-        data: Optional[:class:`str`]
-            The data which was added to the request.
-
-        _ttl: :class:`int`
-            Private param used for recursively setting the retry amount.
-            (Eg set to 1 for 1 max retry)
+        Returns
+        -------
+        Union[Optional[:class:`Dict`], :class:`~pincer.core.http._Retry`]
+            The json response, or a ``_Retry`` if the request must be
+            sent again because of a 429 or 5xx error code.
         """
-        _log.debug(f"Received response for {endpoint} | {await res.text()}")
+        # Reading the body as text is only worth it when it gets logged
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "Received response for %s | %s", endpoint, await res.text()
+            )
 
         self.__rate_limiter.save_response_bucket(
             endpoint, method, res.headers
@@ -247,48 +510,82 @@ class HTTPClient:
         exception = self.__http_exceptions.get(res.status)
 
         if exception:
-            if isinstance(exception, RateLimitError):
-                timeout = (await res.json()).get("retry_after", 40)
+            if exception is RateLimitError:
+                timeout = (await res.json()).get("retry_after")
 
                 _log.exception(
                     f"RateLimitError: {res.reason}."
                     f" The scope is {res.headers.get('X-RateLimit-Scope')}."
-                    f" Retrying in {timeout} seconds"
-                )
-                await sleep(timeout)
-                return await self.__send(
-                    method,
-                    endpoint,
-                    content_type=content_type,
-                    data=data
+                    + (
+                        f" Retrying in {timeout} seconds"
+                        if timeout else " Retrying with backoff"
+                    )
                 )
+                return _Retry(True, timeout)
 
             _log.error(
                 f"An http exception occurred while trying to send "
                 f"a request to {endpoint}. ({res.status}, {res.reason})"
             )
 
-            exception.__init__(res.reason)
-            raise exception
+            raise exception(res.reason)
 
         # status code is guaranteed to be 5xx
-        retry_in = 1 + (self.max_ttl - _ttl) * 2
+        return _Retry(False)
 
-        _log.debug(
-            "Server side error occurred with status code "
-            f"{res.status}. Retrying in {retry_in}s."
-        )
+    def __invalidate_cache(self, endpoint: str):
+        """Remove the cached GET responses a change to an endpoint may have
+        outdated. These are the responses of the endpoint itself, with any
+        query parameters, and of the routes above and below it.
 
-        await sleep(retry_in)
+        GETs of these routes which are still being sent may answer with
+        the old response, so they won't get cached or joined anymore.
 
-        # try sending it again
-        return await self.__send(
-            method,
-            endpoint,
-            content_type=content_type,
-            _ttl=_ttl - 1,
-            data=data
+        Parameters
+        ----------
+        endpoint: :class:`str`
+            The Discord REST endpoint which got changed, without a leading
+            slash.
+        """
+        prefix = endpoint + "/"
+
+        def outdated(route: str) -> bool:
+            return (
+                route == endpoint
+                or route.startswith(prefix)
+                or endpoint.startswith(route + "/")
+            )
+
+        for key in [key for key in self.__get_cache if outdated(key[0])]:
+            del self.__get_cache[key]
+
+        for route, generation in self.__route_generations.items():
+            if outdated(route):
+                generation.generation += 1
+
+        for key in [key for key in self.__inflight_gets if outdated(key[0])]:
+            del self.__inflight_gets[key]
+
+    def __get_cache_ttl(self, route: str) -> float:
+        """Get the amount of seconds to cache GET responses of a route for.
+
+        Parameters
+        ----------
+        route: :class:`str`
+            The Discord REST endpoint, without a leading slash.
+
+        Returns
+        -------
+        :class:`float`
+            The seconds to cache for, ``0`` if the route isn't cached.
+        """
+        if not self.cache_ttls:
+            return 0
+
+        template = "/".join(
+            "{id}" if part.isdigit() else part for part in route.split("/")
         )
+        return self.cache_ttls.get(template, 0)
 
     async def delete(
             self,
@@ -313,7 +610,7 @@ class HTTPClient:
             The response from discord.
         """
         return await self.__send(
-            self.__session.delete,
+            "DELETE",
             route,
             headers=headers
         )
@@ -340,12 +637,99 @@ class HTTPClient:
         Optional[:class:`Dict`]
             The response from discord.
         """
-        return await self.__send(
-            self.__session.get,
-            route,
-            params=params
+        # Identical GET requests which are sent while one is in flight
+        # share its response instead of being sent again. The params are
+        # keyed by their query string, as their values may be lists.
+        # Routes are sent both with and without a leading slash.
+        key = (
+            route.lstrip("/"),
+            urlencode(sorted(remove_none(params).items()), doseq=True)
+            if params else ""
+        )
+        cache_ttl = self.__get_cache_ttl(key[0])
+
+        if cache_ttl and (cached := self.__get_cache.get(key)):
+            cached_at, value = cached
+
+            if monotonic() - cached_at < cache_ttl:
+                return deepcopy(value)
+
+            del self.__get_cache[key]
+
+        if inflight := self.__inflight_gets.get(key):
+            inflight.waiters += 1
+
+            try:
+                # Shielded so a cancelled waiter doesn't cancel the others
+                return deepcopy(await shield(inflight.future))
+            except CancelledError:
+                raise
+            except Exception as error:
+                # Raising the shared exception would make every caller add
+                # to the same traceback.
+                copied = _copy_exception(error)
+
+                if copied is error:
+                    raise
+
+                raise copied from error
+
+        # The first caller sends the request itself, so requests which
+        # don't get joined don't pay for a task.
+        inflight = self.__inflight_gets[key] = _InflightGet(
+            get_running_loop().create_future()
         )
 
+        # A change to the route while the request is sent may not be in
+        # its response, which then mustn't get cached.
+        route_generation = self.__route_generations.setdefault(
+            key[0], _RouteGeneration()
+        )
+        route_generation.gets += 1
+        generation = route_generation.generation
+
+        try:
+            result = await self.__send("GET", route, params=params)
+        except CancelledError:
+            if inflight.waiters:
+                # The others still need the response, so it gets
+                # requested again for them.
+                ensure_future(self.get(route, params)).add_done_callback(
+                    partial(_copy_outcome, inflight.future)
+                )
+
+            raise
+        except Exception as error:
+            if inflight.waiters:
+                inflight.future.set_exception(error)
+
+            raise
+        except BaseException:
+            # Nothing is left to answer the others
+            inflight.future.cancel()
+            raise
+        finally:
+            if self.__inflight_gets.get(key) is inflight:
+                del self.__inflight_gets[key]
+
+            route_generation.gets -= 1
+
+            if not route_generation.gets:
+                del self.__route_generations[key[0]]
+
+        if inflight.waiters:
+            inflight.future.set_result(result)
+
+        if cache_ttl and route_generation.generation == generation:
+            if len(self.__get_cache) >= _GET_CACHE_SIZE:
+                del self.__get_cache[next(iter(self.__get_cache))]
+
+            self.__get_cache[key] = (monotonic(), deepcopy(result))
+
+        # Callers may mutate their response, so it can only be returned
+        # as is when nobody else awaited it.
+        return deepcopy(result) if inflight.waiters else result
+
     async def head(self, route: str) -> Optional[Dict]:
         """|coro|
 
@@ -361,7 +745,7 @@ class HTTPClient:
         Optional[:class:`Dict`]
             The response from discord.
         """
-        return await self.__send(self.__session.head, route)
+        return await self.__send("HEAD", route)
 
     async def options(self, route: str) -> Optional[Dict]:
         """|coro|
@@ -378,7 +762,7 @@ class HTTPClient:
         Optional[:class:`Dict`]
             The response from discord.
         """
-        return await self.__send(self.__session.options, route)
+        return await self.__send("OPTIONS", route)
 
     async def patch(
             self,
@@ -409,7 +793,7 @@ class HTTPClient:
             JSON response from the discord API.
         """
         return await self.__send(
-            self.__session.patch,
+            "PATCH",
             route,
             content_type=content_type,
             data=data,
@@ -444,7 +828,7 @@ class HTTPClient:
             JSON response from the discord API.
         """
         return await self.__send(
-            self.__session.post,
+            "POST",
             route,
             content_type=content_type,
             data=data,
@@ -479,7 +863,7 @@ class HTTPClient:
             JSON response from the discord API.
         """
         return await self.__send(
-            self.__session.put,
+            "PUT",
             route,
             content_type=content_type,
             data=data,
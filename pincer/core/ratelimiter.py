@@ -3,14 +3,14 @@
 
 from __future__ import annotations
 
-from asyncio import sleep
+from asyncio import Semaphore, sleep
 from dataclasses import dataclass
 import logging
 from time import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Dict, Tuple
+    from typing import Dict, Optional, Tuple
     from .http import HttpCallable
 
 _log = logging.getLogger(__name__)
@@ -48,11 +48,18 @@ class RateLimiter:
         Maps endpoints and methods to a rate limit bucket
     buckets : Dict[str, :class:`~pincer.core.ratelimiter.Bucket`]
         Dictionary of buckets
-    """
+    semaphores : Dict[Tuple[str, :class:`~pincer.core.http.HttpCallable`], :class:`asyncio.Semaphore`]
+        Caps the amount of in-flight requests per endpoint and method to
+        the limit of their bucket. Discord counts the limits of a bucket
+        per major parameter, so endpoints sharing a bucket don't share a
+        semaphore.
+    """  # noqa: E501
 
     def __init__(self) -> None:
         self.bucket_map: Dict[Tuple[str, HttpCallable], str] = {}
         self.buckets: Dict[str, Bucket] = {}
+        self.semaphores: Dict[Tuple[str, HttpCallable], Semaphore] = {}
+        self.__semaphore_limits: Dict[Tuple[str, HttpCallable], int] = {}
 
     def save_response_bucket(
         self,
@@ -75,10 +82,18 @@ class RateLimiter:
         if not bucket_id:
             return
 
-        self.bucket_map[endpoint, method] = bucket_id
+        key = (endpoint, method)
+        self.bucket_map[key] = bucket_id
+        limit = int(header["X-RateLimit-Limit"])
+
+        if self.__semaphore_limits.get(key) != limit:
+            # Requests in flight release the semaphore they acquired,
+            # so replacing it on a limit change is safe.
+            self.semaphores[key] = Semaphore(max(limit, 1))
+            self.__semaphore_limits[key] = limit
 
         self.buckets[bucket_id] = Bucket(
-            limit=int(header["X-RateLimit-Limit"]),
+            limit=limit,
             remaining=int(header["X-RateLimit-Remaining"]),
             reset=float(header["X-RateLimit-Reset"]),
             reset_after=float(header["X-RateLimit-Reset-After"]),
@@ -95,7 +110,7 @@ class RateLimiter:
         self,
         endpoint: str,
         method: HttpCallable
-    ):
+    ) -> Optional[Semaphore]:
         """|coro|
         Waits until the response no longer needs to be blocked to prevent a
         429 response because of ``user`` rate limits.
@@ -106,11 +121,23 @@ class RateLimiter:
             The endpoint
         method : :class:`~pincer.core.http.HttpCallable`
             The method used on the endpoint (E.g. ``Get``, ``Post``, ``Patch``)
+
+        Returns
+        -------
+        Optional[:class:`asyncio.Semaphore`]
+            The acquired semaphore of the endpoint, which must be released
+            once the response has been received. :data:`None` when the endpoint
+            has no known bucket.
         """
-        bucket_id = self.bucket_map.get((endpoint, method))
+        key = (endpoint, method)
+        bucket_id = self.bucket_map.get(key)
 
         if not bucket_id:
-            return
+            return None
+
+        semaphore = self.semaphores[key]
+        # Doesn't suspend while the bucket has requests to spare
+        await semaphore.acquire()
 
         bucket = self.buckets[bucket_id]
         cur_time = time()
@@ -124,9 +151,15 @@ class RateLimiter:
                 bucket_id
             )
 
-            await sleep(sleep_time)
+            try:
+                await sleep(sleep_time)
+            except BaseException:
+                semaphore.release()
+                raise
 
             _log.info(
                 "Message sent. Bucket %s rate limit ended.",
                 bucket_id
             )
+
+        return semaphore
@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import logging
 from contextlib import suppress
-from inspect import isasyncgenfunction, _empty
 from typing import TYPE_CHECKING
 
 from ..commands import ChatCommandHandler, ComponentHandler
@@ -17,9 +16,9 @@ from ..objects import (
     AppCommandType,
     InteractionType,
 )
-from ..utils import MISSING, should_pass_cls, Coro, should_pass_ctx
+from ..utils import MISSING, Coro
 from ..utils import get_index
-from ..utils.signature import get_signature_and_params
+from ..utils.signature import get_command_info, get_signature_and_params
 
 if TYPE_CHECKING:
     from typing import Any, Dict, List, Tuple
@@ -125,14 +124,14 @@ async def interaction_response_handler(
     \\*\\*kwargs :
         The arguments to be passed to the command.
     """
-    sig, params = get_signature_and_params(command)
-    if should_pass_ctx(sig, params):
+    info = get_command_info(command)
+    if info.pass_ctx:
         args.insert(0, context)
 
-    if should_pass_cls(command):
+    if info.pass_cls:
         args.insert(0, ChatCommandHandler.managers[command.__module__])
 
-    if isasyncgenfunction(command):
+    if info.is_async_gen:
         message = command(*args, **kwargs)
 
         async for msg in message:
@@ -162,14 +161,7 @@ async def interaction_handler(
     command : :class:`~pincer.utils.types.Coro`
         The coroutine which will be seen as a command.
     """
-    sig, _ = get_signature_and_params(command)
-
-    defaults = {
-        key: value.default
-        for key, value in sig.items()
-        if value.default is not _empty
-    }
-    params = {}
+    kwargs = get_command_info(command).defaults.copy()
 
     def get_options_from_command(options):
         if not options:
@@ -183,7 +175,8 @@ async def interaction_handler(
     options = get_options_from_command(interaction.data.options)
 
     if options is not MISSING:
-        params = {opt.name: opt.value for opt in options}
+        for opt in options:
+            kwargs[opt.name] = opt.value
 
     args = []
 
@@ -205,8 +198,6 @@ async def interaction_handler(
     if interaction.data.values:
         args.append(interaction.data.values)
 
-    kwargs = {**defaults, **params}
-
     await interaction_response_handler(
         command, context, interaction, args, kwargs
     )
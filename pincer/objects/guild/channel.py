@@ -3,11 +3,13 @@
 
 from __future__ import annotations
 
+import sys
 from asyncio import sleep, ensure_future
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import IntEnum
+from types import MappingProxyType
 from urllib.parse import urlencode
-from typing import AsyncIterator, overload, TYPE_CHECKING
+from typing import AsyncIterator, TYPE_CHECKING
 
 from .invite import Invite, InviteTargetType
 from ..message.user_message import UserMessage
@@ -17,7 +19,10 @@ from ...utils.convert_message import convert_message
 from ...utils.types import MISSING
 
 if TYPE_CHECKING:
-    from typing import AsyncGenerator, Dict, List, Optional, Union
+    from typing import (
+        Any, AsyncGenerator, Dict, List, Mapping, Optional, Type, Union,
+        overload
+    )
 
     from .member import GuildMember
     from .overwrite import Overwrite
@@ -32,6 +37,10 @@ if TYPE_CHECKING:
     from ...utils.types import APINullable
     from ...utils.snowflake import Snowflake
 
+# Channels get created in bulk, so their instances shouldn't carry a
+# ``__dict__``. ``dataclass`` only supports slots since Python 3.10.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class ChannelType(IntEnum):
     """Represents a channel its type.
@@ -78,7 +87,7 @@ class ChannelType(IntEnum):
     GUILD_STAGE_VOICE = 13
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, **_SLOTS)
 class Channel(APIObject, GuildProperty):  # noqa E501
     """Represents a Discord Channel Mention object
 
@@ -184,9 +193,22 @@ class Channel(APIObject, GuildProperty):  # noqa E501
     user_limit: APINullable[int] = MISSING
     video_quality_mode: APINullable[int] = MISSING
 
+    _mention: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def mention(self):
-        return f"<#{self.id}>"
+        # The id of a channel doesn't change, so the mention is only
+        # formatted once.
+        if self._mention is None:
+            self._mention = f"<#{self.id}>"
+
+        return self._mention
+
+    def __hash__(self) -> int:
+        # Snowflakes are unique, so the id is enough to hash a channel.
+        return hash(self.id)
 
     @classmethod
     async def from_id(cls, client: Client, channel_id: int) -> Channel:
@@ -211,30 +233,28 @@ class Channel(APIObject, GuildProperty):  # noqa E501
         """
         data = (await client.http.get(f"channels/{channel_id}")) or {}
 
-        data.update({"type": ChannelType(data.pop("type"))})
-
-        channel_cls = _channel_type_map.get(data["type"], Channel)
-        return channel_cls.from_dict(data)
-
-    @overload
-    async def edit(
-        self,
-        *,
-        name: str = None,
-        type: ChannelType = None,
-        position: int = None,
-        topic: str = None,
-        nsfw: bool = None,
-        rate_limit_per_user: int = None,
-        bitrate: int = None,
-        user_limit: int = None,
-        permissions_overwrites: List[Overwrite] = None,
-        parent_id: Snowflake = None,
-        rtc_region: str = None,
-        video_quality_mod: int = None,
-        default_auto_archive_duration: int = None,
-    ) -> Channel:
-        ...
+        return _channel_from_dict(data)
+
+    if TYPE_CHECKING:
+        @overload
+        async def edit(
+            self,
+            *,
+            name: str = None,
+            type: ChannelType = None,
+            position: int = None,
+            topic: str = None,
+            nsfw: bool = None,
+            rate_limit_per_user: int = None,
+            bitrate: int = None,
+            user_limit: int = None,
+            permissions_overwrites: List[Overwrite] = None,
+            parent_id: Snowflake = None,
+            rtc_region: str = None,
+            video_quality_mod: int = None,
+            default_auto_archive_duration: int = None,
+        ) -> Channel:
+            ...
 
     async def edit(self, reason: Optional[str] = None, **kwargs):
         """|coro|
@@ -260,9 +280,7 @@ class Channel(APIObject, GuildProperty):  # noqa E501
         data = await self._http.patch(
             f"channels/{self.id}", kwargs, headers=headers
         )
-        data.update({"type": ChannelType(data.pop("type"))})
-        channel_cls = _channel_type_map.get(data["type"], Channel)
-        return channel_cls.from_dict(data)
+        return _channel_from_dict(data)
 
     async def edit_permissions(
         self,
@@ -730,20 +748,23 @@ class Channel(APIObject, GuildProperty):  # noqa E501
 class TextChannel(Channel):
     """A subclass of ``Channel`` for text channels with all the same attributes."""
 
-    @overload
-    async def edit(
-        self,
-        name: str = None,
-        type: ChannelType = None,
-        position: int = None,
-        topic: str = None,
-        nsfw: bool = None,
-        rate_limit_per_user: int = None,
-        permissions_overwrites: List[Overwrite] = None,
-        parent_id: Snowflake = None,
-        default_auto_archive_duration: int = None,
-    ) -> Union[TextChannel, NewsChannel]:
-        ...
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        @overload
+        async def edit(
+            self,
+            name: str = None,
+            type: ChannelType = None,
+            position: int = None,
+            topic: str = None,
+            nsfw: bool = None,
+            rate_limit_per_user: int = None,
+            permissions_overwrites: List[Overwrite] = None,
+            parent_id: Snowflake = None,
+            default_auto_archive_duration: int = None,
+        ) -> Union[TextChannel, NewsChannel]:
+            ...
 
     async def edit(self, **kwargs):
         """|coro|
@@ -783,18 +804,21 @@ class TextChannel(Channel):
 class VoiceChannel(Channel):
     """A subclass of ``Channel`` for voice channels with all the same attributes."""
 
-    @overload
-    async def edit(
-        self,
-        name: str = None,
-        position: int = None,
-        bitrate: int = None,
-        user_limit: int = None,
-        permissions_overwrites: List[Overwrite] = None,
-        rtc_region: str = None,
-        video_quality_mod: int = None,
-    ) -> VoiceChannel:
-        ...
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        @overload
+        async def edit(
+            self,
+            name: str = None,
+            position: int = None,
+            bitrate: int = None,
+            user_limit: int = None,
+            permissions_overwrites: List[Overwrite] = None,
+            rtc_region: str = None,
+            video_quality_mod: int = None,
+        ) -> VoiceChannel:
+            ...
 
     async def edit(self, **kwargs):
         """|coro|
@@ -816,29 +840,36 @@ class VoiceChannel(Channel):
 class GroupDMChannel(Channel):
     """A subclass of ``Channel`` for Group DMs"""
 
+    __slots__ = ()
+
 
 class CategoryChannel(Channel):
     """A subclass of ``Channel`` for categories channels
     with all the same attributes.
     """
 
+    __slots__ = ()
+
 
 class NewsChannel(Channel):
     """A subclass of ``Channel`` for news channels with all the same attributes."""
 
-    @overload
-    async def edit(
-        self,
-        name: str = None,
-        type: ChannelType = None,
-        position: int = None,
-        topic: str = None,
-        nsfw: bool = None,
-        permissions_overwrites: List[Overwrite] = None,
-        parent_id: Snowflake = None,
-        default_auto_archive_duration: int = None,
-    ) -> Union[TextChannel, NewsChannel]:
-        ...
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        @overload
+        async def edit(
+            self,
+            name: str = None,
+            type: ChannelType = None,
+            position: int = None,
+            topic: str = None,
+            nsfw: bool = None,
+            permissions_overwrites: List[Overwrite] = None,
+            parent_id: Snowflake = None,
+            default_auto_archive_duration: int = None,
+        ) -> Union[TextChannel, NewsChannel]:
+            ...
 
     async def edit(self, **kwargs):
         """|coro|
@@ -860,6 +891,8 @@ class NewsChannel(Channel):
 class Thread(Channel):
     """A subclass of ``Channel`` for threads with all the same attributes."""
 
+    __slots__ = ()
+
     async def start(
         self,
         name: Optional[str] = None,
@@ -1058,10 +1091,14 @@ class Thread(Channel):
 class PublicThread(Thread):
     """A subclass of ``Thread`` for public threads with all the same attributes."""
 
+    __slots__ = ()
+
 
 class PrivateThread(Thread):
     """A subclass of ``Thread`` for private threads with all the same attributes."""
 
+    __slots__ = ()
+
 
 @dataclass(repr=False)
 class ThreadsResponse(APIObject):
@@ -1072,7 +1109,7 @@ class ThreadsResponse(APIObject):
     has_more: bool
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, **_SLOTS)
 class ChannelMention(APIObject):
     """Represents a Discord Channel Mention object
 
@@ -1093,14 +1130,27 @@ class ChannelMention(APIObject):
     type: ChannelType
     name: str
 
+    def __hash__(self) -> int:
+        return hash(self.id)
 
+
+# Keyed by the raw value, so the ``type`` of a payload can be looked up
+# without converting it to a ``ChannelType`` first. It's read-only, so it
+# can't get changed by accident.
 # noinspection PyTypeChecker
-_channel_type_map: Dict[ChannelType, Channel] = {
-    ChannelType.GUILD_TEXT: TextChannel,
-    ChannelType.GUILD_VOICE: VoiceChannel,
-    ChannelType.GROUP_DM: GroupDMChannel,
-    ChannelType.GUILD_CATEGORY: CategoryChannel,
-    ChannelType.GUILD_NEWS: NewsChannel,
-    ChannelType.GUILD_PUBLIC_THREAD: PublicThread,
-    ChannelType.GUILD_PRIVATE_THREAD: PrivateThread,
-}
+_channel_type_map: Mapping[int, Type[Channel]] = MappingProxyType({
+    ChannelType.GUILD_TEXT.value: TextChannel,
+    ChannelType.GUILD_VOICE.value: VoiceChannel,
+    ChannelType.GROUP_DM.value: GroupDMChannel,
+    ChannelType.GUILD_CATEGORY.value: CategoryChannel,
+    ChannelType.GUILD_NEWS.value: NewsChannel,
+    ChannelType.GUILD_PUBLIC_THREAD.value: PublicThread,
+    ChannelType.GUILD_PRIVATE_THREAD.value: PrivateThread,
+})
+
+
+def _channel_from_dict(data: Dict[str, Any]) -> Channel:
+    """Create the channel subclass which belongs to the type of a channel
+    payload, falling back to :class:`~pincer.objects.guild.channel.Channel`.
+    """
+    return _channel_type_map.get(data["type"], Channel).from_dict(data)
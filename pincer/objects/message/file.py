@@ -7,12 +7,12 @@ import os
 from base64 import b64encode
 from dataclasses import dataclass
 from io import BytesIO
-from json import dumps
 from typing import TYPE_CHECKING
 
 from aiohttp import FormData, Payload
 
 from ...exceptions import ImageEncodingError
+from ...utils.conversion import json_dumps
 
 if TYPE_CHECKING:
     from typing import Any, Dict, List, Optional, Tuple
@@ -48,7 +48,7 @@ def create_form(
         The content type and the payload to be sent in an HTTP request.
     """
     form = FormData()
-    form.add_field("payload_json", dumps(json_payload))
+    form.add_field("payload_json", json_dumps(json_payload).decode())
 
     for file in files:
         if not file.filename:
@@ -3,13 +3,18 @@
 
 from .api_object import APIObject, ChannelProperty, GuildProperty
 from .color import Color
-from .conversion import remove_none
+from .conversion import json_dumps, remove_none
 from .directory import chdir
 from .event_mgr import EventMgr
 from .extraction import get_index
 from .insertion import should_pass_cls, should_pass_ctx
 from .replace import replace
-from .signature import get_params, get_signature_and_params
+from .signature import (
+    CommandInfo,
+    get_command_info,
+    get_params,
+    get_signature_and_params,
+)
 from .snowflake import Snowflake
 from .tasks import Task, TaskScheduler
 from .timestamp import Timestamp
@@ -24,9 +29,10 @@ from .types import (
 
 __all__ = (
     "", "APINullable", "APIObject", "ChannelProperty",
-    "CheckFunction", "Color", "Coro", "EventMgr", "GuildProperty", "MISSING",
-    "MissingType", "Snowflake", "Task", "TaskScheduler", "Timestamp", "chdir",
-    "choice_value_types", "get_index", "get_params",
-    "get_signature_and_params", "remove_none", "replace", "should_pass_cls",
+    "CheckFunction", "Color", "CommandInfo", "Coro", "EventMgr",
+    "GuildProperty", "MISSING", "MissingType", "Snowflake", "Task",
+    "TaskScheduler", "Timestamp", "chdir", "choice_value_types",
+    "get_command_info", "get_index", "get_params", "get_signature_and_params",
+    "json_dumps", "remove_none", "replace", "should_pass_cls",
     "should_pass_ctx"
 )
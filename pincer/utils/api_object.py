@@ -37,6 +37,15 @@ T = TypeVar("T")
 
 _log = logging.getLogger(__package__)
 
+# The arguments of the `__init__` of every class `from_dict` was used on.
+_init_args: Dict[type, Tuple[str, ...]] = {}
+
+# The name, type, type origin and type arguments of an attribute.
+_AttrTypes = Tuple[str, type, Optional[type], Tuple[type, ...]]
+
+# The attributes `__post_init__` converts, per class.
+_attr_types: Dict[type, Tuple[_AttrTypes, ...]] = {}
+
 
 def _asdict_ignore_none(obj: Generic[T]) -> Union[Tuple, Dict, T]:
     """
@@ -90,6 +99,9 @@ class APIObject:
     Represents an object which has been fetched from the Discord API.
     """
 
+    # Empty so subclasses which define slots don't get a ``__dict__``
+    __slots__ = ()
+
     _client: Optional[Client] = None
 
     @property
@@ -178,22 +190,53 @@ class APIObject:
         if attr_type is not None and isinstance(attr_value, attr_type):
             return attr_value
 
+        # Look enum members up directly, calling the enum is a lot slower.
+        if isinstance(attr_type, EnumMeta) and (
+            member := attr_type._value2member_map_.get(attr_value)
+        ) is not None:
+            return member
+
         if isinstance(attr_value, dict):
             return factory(attr_value)
 
         return factory(attr_value)
 
-    def __post_init__(self):
+    def __get_attr_types(self) -> Tuple[_AttrTypes, ...]:
+        """Get the public attributes of the object with the type they have
+        to be converted to. These only get resolved once per class.
+
+        Returns
+        -------
+        Tuple[Tuple[:class:`str`, :class:`type`, Optional[:class:`type`], Tuple[:class:`type`]]]
+            The name, type, origin of the type and arguments of the type
+            for every attribute.
+
+        Raises
+        ------
+        :class:`~pincer.exceptions.InvalidArgumentAnnotation`
+            Exception which is raised when an attribute only has missing
+            or optional types.
+        """  # noqa: E501
+        cls = type(self)
+        attr_types = _attr_types.get(cls)
+
+        if attr_types is not None:
+            return attr_types
+
         TypeCache()
 
-        attributes = chain(
-            *(
-                get_type_hints(cls, globalns=TypeCache.cache).items()
-                for cls in chain(self.__class__.__bases__, (self,))
+        attributes = dict(
+            chain(
+                *(
+                    get_type_hints(base, globalns=TypeCache.cache).items()
+                    for base in chain(cls.__bases__, (self,))
+                )
             )
         )
 
-        for attr, attr_type in attributes:
+        resolved = []
+
+        for attr, attr_type in attributes.items():
             # Ignore private attributes.
             if attr.startswith("_"):
                 continue
@@ -208,25 +251,36 @@ class APIObject:
 
             if not types:
                 raise InvalidArgumentAnnotation(
-                    f"Attribute `{attr}` in `{type(self).__name__}` only "
+                    f"Attribute `{attr}` in `{cls.__name__}` only "
                     "consisted of missing/optional type!"
                 )
 
             specific_tp = types[0]
+            tp = get_origin(specific_tp)
+
+            resolved.append(
+                (attr, tp or specific_tp, tp, get_args(specific_tp))
+            )
+
+        attr_types = _attr_types[cls] = tuple(resolved)
+        return attr_types
 
+    def __post_init__(self):
+        for attr, specific_tp, tp, classes in self.__get_attr_types():
             attr_gotten = getattr(self, attr)
 
-            if tp := get_origin(specific_tp):
-                specific_tp = tp
+            # Most attributes are missing, those never need converting.
+            if attr_gotten is MISSING:
+                continue
 
             if isinstance(specific_tp, EnumMeta) and not attr_gotten:
                 attr_value = MISSING
-            elif tp == list and attr_gotten and (classes := get_args(types[0])):
+            elif tp == list and attr_gotten and classes:
                 attr_value = [
                     self.__attr_convert(attr_item, classes[0])
                     for attr_item in attr_gotten
                 ]
-            elif tp == dict and attr_gotten and (classes := get_args(types[0])):
+            elif tp == dict and attr_gotten and classes:
                 attr_value = {
                     key: self.__attr_convert(value, classes[1])
                     for key, value in attr_gotten.items()
@@ -242,9 +296,14 @@ class APIObject:
         return cls.from_dict(*args, **kwargs)
 
     def __repr__(self):
+        values = getattr(self, "__dict__", None)
+
+        if values is None:
+            values = {f.name: getattr(self, f.name) for f in fields(self)}
+
         attrs = ", ".join(
             f"{k}={v!r}"
-            for k, v in self.__dict__.items()
+            for k, v in values.items()
             if v and not k.startswith("_")
         )
 
@@ -273,25 +332,23 @@ class APIObject:
         if isinstance(data, cls):
             return data
 
+        args = _init_args.get(cls)
+
+        if args is None:
+            # Skip `self`, it never is in the data.
+            args = _init_args[cls] = tuple(
+                getfullargspec(cls.__init__).args[1:]
+            )
+
         # Disable inspection for IDE because this is valid code for the
         # inherited classes:
         # noinspection PyArgumentList
         return cls(
-            **dict(
-                map(
-                    lambda key: (
-                        key,
-                        data[key].value
-                        if isinstance(data[key], Enum)
-                        else data[key],
-                    ),
-                    filter(
-                        lambda object_argument: data.get(object_argument)
-                        is not None,
-                        getfullargspec(cls.__init__).args,
-                    ),
-                )
-            )
+            **{
+                key: value.value if isinstance(value, Enum) else value
+                for key in args
+                if (value := data.get(key)) is not None
+            }
         )
 
     def to_dict(self) -> Dict:
@@ -303,6 +360,8 @@ class APIObject:
 
 
 class GuildProperty:
+    __slots__ = ()
+
     @property
     def guild(self) -> Guild:
         """Return a guild from an APIObject
@@ -318,6 +377,8 @@ class GuildProperty:
 
 
 class ChannelProperty:
+    __slots__ = ()
+
     @property
     def channel(self) -> Channel:
         """Return a channel from an APIObject
@@ -6,7 +6,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Dict, List, Set, Union, Tuple
+    from typing import Any, Dict, List, Set, Union, Tuple
+
+try:
+    from orjson import dumps as _dumps
+except (ModuleNotFoundError, ImportError):
+    from json import dumps as _json_dumps
+
+    def _dumps(obj: Any) -> bytes:
+        return _json_dumps(obj).encode()
 
 
 def remove_none(
@@ -33,3 +41,20 @@ def remove_none(
         return obj - {None}
     elif isinstance(obj, dict):
         return {k: v for k, v in obj.items() if None not in (k, v)}
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Encodes an object to JSON, using ``orjson`` when it is installed.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to encode.
+
+    Returns
+    -------
+    bytes
+        The UTF-8 encoded JSON.
+    """
+    return _dumps(obj)
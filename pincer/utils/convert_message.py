@@ -43,6 +43,13 @@ def convert_message(client: Client, message: MessageConvertable) -> Message:
     :class:`~pincer.objects.message.message.Message`
         The message object to be sent
     """
+    # Fast paths for what commands return most, which skip the
+    # ``Iterable`` ABC check below.
+    if isinstance(message, Message):
+        return message
+    if message and isinstance(message, str):
+        return Message(message)
+
     if message and isinstance(message, Iterable) and not isinstance(message, str):
         kwargs = defaultdict(list)
         for item in message:
@@ -1,10 +1,41 @@
 # Copyright Pincer 2021-Present
 # Full MIT License can be found in `LICENSE` at the project root.
 
-from inspect import signature, isclass
-from typing import Callable
+from __future__ import annotations
 
-from .insertion import should_pass_cls
+from contextlib import suppress
+from inspect import isasyncgenfunction, isclass, signature, _empty
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+from .insertion import should_pass_cls, should_pass_ctx
+
+if TYPE_CHECKING:
+    from typing import Any, Dict
+
+    from .types import Coro
+
+
+class CommandInfo(NamedTuple):
+    """The introspected parts of a command which are needed to call it.
+
+    Attributes
+    ----------
+    defaults : Dict[:class:`str`, Any]
+        The default values of the parameters which have one.
+    pass_ctx : :class:`bool`
+        Whether the context should be passed to the command.
+    pass_cls : :class:`bool`
+        Whether the command requires a self/cls as first parameter.
+    is_async_gen : :class:`bool`
+        Whether the command is an async generator.
+    """
+    defaults: Dict[str, Any]
+    pass_ctx: bool
+    pass_cls: bool
+    is_async_gen: bool
+
+
+_command_info: Dict[Coro, CommandInfo] = {}
 
 
 def get_signature_and_params(func: Callable):
@@ -45,3 +76,36 @@ def get_params(func: Callable):
         List of parameters of the coroutine.
     """
     return get_signature_and_params(func)[1]
+
+
+def get_command_info(command: Coro) -> CommandInfo:
+    """Introspect a command. The result is cached, commands and components
+    get introspected when they are registered so calling them doesn't have
+    to.
+
+    Parameters
+    ----------
+    command : :class:`~pincer.utils.types.Coro`
+        The coroutine which will be seen as a command.
+
+    Returns
+    -------
+    :class:`~pincer.utils.signature.CommandInfo`
+        The information required to call the command.
+    """
+    with suppress(KeyError):
+        return _command_info[command]
+
+    sig, params = get_signature_and_params(command)
+
+    info = _command_info[command] = CommandInfo(
+        defaults={
+            key: value.default
+            for key, value in sig.items()
+            if value.default is not _empty
+        },
+        pass_ctx=should_pass_ctx(sig, params),
+        pass_cls=should_pass_cls(command),
+        is_async_gen=isasyncgenfunction(command),
+    )
+    return info
@@ -1,46 +1,84 @@
 # Copyright Pincer 2021-Present
 # Full MIT License can be found in `LICENSE` at the project root.
 
-from os import walk
+from concurrent.futures import ThreadPoolExecutor
+from os import scandir
+from typing import Iterator
 
 from pincer import __version__
 
+# Turns the path of a package into its dotted name.
+_PATH_TO_PACKAGE = str.maketrans({"\\": ".", "/": "."})
+
+
+def walk_packages(path: str) -> Iterator[str]:
+    yield path
+
+    with scandir(path) as entries:
+        directories = [
+            entry.path for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+            and entry.name != "__pycache__"
+        ]
+
+    for directory in directories:
+        yield from walk_packages(directory)
+
 
 def get_packages():
     return '\n\t'.join(
-        item[0].replace("./", "").replace("\\", ".").replace("/", ".")
-        for item in list(walk('pincer')) if "__pycache__" not in item[0]
+        path.translate(_PATH_TO_PACKAGE)
+        for path in walk_packages('pincer')
     )
 
 
+def read_file(path: str) -> str:
+    with open(path) as f:
+        return f.read()
+
+
 def get_dependencies(path: str) -> str:
     with open(path) as f:
-        return '\n\t'.join(f.read().strip().splitlines())
+        return f.read().strip().replace('\n', '\n\t')
 
 
 def main():
     with open("VERSION", "w") as f:
         f.write(__version__)
 
-    packages = get_packages()
+    # The files get read in the background while the packages are listed.
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        base_future = executor.submit(read_file, "./setup_config/base.cfg")
 
-    with open("./setup_config/base.cfg") as f:
-        base = f.read()
+        dependency_futures = {
+            "requires": executor.submit(
+                get_dependencies, "requirements.txt"
+            ),
+            "testing_requires": executor.submit(
+                get_dependencies, "packages/dev.txt"
+            ),
+            "images_requires": executor.submit(
+                get_dependencies, "packages/img.txt"
+            ),
+            "speed_requires": executor.submit(
+                get_dependencies, "packages/speed.txt"
+            )
+        }
 
+        packages = get_packages()
+
+    base = base_future.result()
     dependencies = {
-        "requires": get_dependencies("requirements.txt"),
-        "testing_requires": get_dependencies("packages/dev.txt"),
-        "images_requires": get_dependencies("packages/img.txt"),
-        "speed_requires": get_dependencies("packages/speed.txt")
+        key: future.result() for key, future in dependency_futures.items()
     }
 
     with open("setup.cfg", "w") as f:
         f.write(
-            base.format(
-                version=__version__,
-                packages=packages,
+            base % {
+                "version": __version__,
+                "packages": packages,
                 **dependencies
-            )
+            }
         )
 
 
@@ -9,3 +9,14 @@ def assert_not_raises():
     """Dummy context manager to highlight a row of a test
     that should not raises any exception"""
     yield
+
+
+def bucket_headers(limit=1, remaining=1, reset_after=0):
+    """Rate limit headers of a response, as sent by Discord."""
+    return {
+        "X-RateLimit-Bucket": "bucket",
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": "0",
+        "X-RateLimit-Reset-After": str(reset_after),
+    }
@@ -0,0 +1,379 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from asyncio import ensure_future, gather, run, sleep, wait_for
+from contextlib import asynccontextmanager
+from json import loads
+
+import pytest
+from aiohttp import ClientSession, web
+
+import pincer.core.http
+from pincer.core.http import HTTPClient
+from pincer.exceptions import NotFoundError, ServerError
+from tests._utils import bucket_headers
+
+
+def make_handler(*responses, delay=0):
+    """Create a handler which records the requests it gets and answers
+    them with ``responses`` in order, repeating the last one.
+
+    A response is a dict with an optional ``status``, ``reason``,
+    ``headers``, ``json`` body and ``delay`` which overrides the default
+    one. The default body holds the amount of requests with the same
+    method, route and query parameters.
+    """
+    requests = []
+    counts = {}
+
+    async def handler(request):
+        key = (request.method, request.path_qs)
+        count = counts[key] = counts.get(key, 0) + 1
+        requests.append(
+            (request.path_qs, dict(request.headers), await request.text())
+        )
+
+        response = (
+            responses[min(len(requests), len(responses)) - 1]
+            if responses else {}
+        )
+
+        if response.get("delay", delay):
+            await sleep(response.get("delay", delay))
+
+        return web.json_response(
+            response.get("json", {"count": count, "items": []}),
+            status=response.get("status", 200),
+            reason=response.get("reason"),
+            headers=response.get("headers"),
+        )
+
+    handler.requests = requests
+    return handler
+
+
+@asynccontextmanager
+async def serve(handler, **kwargs):
+    """Run ``handler`` on a local server and yield a client sending all
+    its requests to it."""
+    app = web.Application()
+    app.router.add_route("*", "/{route:.*}", handler)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+
+    client = HTTPClient("token", **kwargs)
+    client.url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+    try:
+        yield client
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+
+@pytest.fixture
+def fast_backoff(monkeypatch):
+    monkeypatch.setattr(pincer.core.http, "_BACKOFF_BASE", 0.001)
+    monkeypatch.setattr(pincer.core.http, "_BACKOFF_CAP", 0.01)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the delays the client sleeps for, without sleeping."""
+    delays = []
+
+    async def record_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(pincer.core.http, "sleep", record_sleep)
+    return delays
+
+
+class TestCache:
+
+    @pytest.mark.asyncio
+    async def test_hit_and_expiry(self):
+        async with serve(make_handler(), cache_ttls={"foo": 0.1}) as http:
+            assert (await http.get("foo"))["count"] == 1
+            assert (await http.get("foo"))["count"] == 1
+
+            await sleep(0.15)
+            assert (await http.get("foo"))["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_uncached_route(self):
+        async with serve(make_handler(), cache_ttls={"foo": 60}) as http:
+            assert (await http.get("bar"))["count"] == 1
+            assert (await http.get("bar"))["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_ids_in_route(self):
+        ttls = {"guilds/{id}": 60}
+
+        async with serve(make_handler(), cache_ttls=ttls) as http:
+            assert (await http.get("guilds/1"))["count"] == 1
+            assert (await http.get("guilds/1"))["count"] == 1
+            assert (await http.get("guilds/2"))["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidated_by_changes(self):
+        ttls = {"guilds/{id}": 60, "guilds/{id}/roles": 60}
+
+        async with serve(make_handler(), cache_ttls=ttls) as http:
+            await http.get("guilds/1")
+            await http.get("guilds/1", params={"with_counts": "true"})
+            await http.get("guilds/1/roles")
+            await http.get("guilds/2")
+
+            await http.patch("guilds/1", {"name": "foo"})
+
+            assert (await http.get("guilds/1"))["count"] == 2
+            assert (await http.get(
+                "guilds/1", params={"with_counts": "true"}
+            ))["count"] == 2
+            assert (await http.get("guilds/1/roles"))["count"] == 2
+            assert (await http.get("guilds/2"))["count"] == 1
+
+            await http.delete("guilds/1/roles/3")
+            assert (await http.get("guilds/1/roles"))["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_changed_while_sent(self):
+        handler = make_handler({"delay": 0.05}, {})
+
+        async with serve(handler, cache_ttls={"foo": 60}) as http:
+            old = ensure_future(http.get("foo"))
+            await sleep(0.01)
+
+            await http.patch("foo", {"name": "bar"})
+            # Doesn't join the request sent before the change
+            assert (await http.get("foo"))["count"] == 2
+            assert (await old)["count"] == 1
+
+            assert (await http.get("foo"))["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_leading_slash(self):
+        ttls = {"guilds/{id}": 60}
+
+        async with serve(make_handler(), cache_ttls=ttls) as http:
+            assert (await http.get("/guilds/1"))["count"] == 1
+            assert (await http.get("guilds/1"))["count"] == 1
+
+            await http.patch("guilds/1", {"name": "foo"})
+            assert (await http.get("/guilds/1"))["count"] == 2
+
+            # The first responses came from "//guilds/1", so a fresh
+            # response from "/guilds/1" starts counting again.
+            await http.patch("/guilds/1", {"name": "bar"})
+            assert (await http.get("guilds/1"))["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_independent_copies(self):
+        async with serve(make_handler(), cache_ttls={"foo": 60}) as http:
+            first = await http.get("foo")
+            first["items"].append(1)
+
+            second = await http.get("foo")
+            assert second == {"count": 1, "items": []}
+            assert second is not first
+            assert second["items"] is not (await http.get("foo"))["items"]
+
+
+class TestCoalescing:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_request(self):
+        handler = make_handler(delay=0.05)
+
+        async with serve(handler) as http:
+            responses = await gather(*(http.get("foo") for _ in range(5)))
+
+        assert len(handler.requests) == 1
+        assert all(response["count"] == 1 for response in responses)
+        assert len({id(response) for response in responses}) == 5
+        assert len({id(response["items"]) for response in responses}) == 5
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_sent_separately(self):
+        handler = make_handler(delay=0.05)
+
+        async with serve(handler) as http:
+            await gather(http.get("foo"), http.get("foo", params={"a": 1}))
+
+        assert sorted(path for path, _, _ in handler.requests) == [
+            "/foo", "/foo?a=1"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_params(self):
+        handler = make_handler(delay=0.05)
+
+        async with serve(handler, cache_ttls={"foo": 60}) as http:
+            responses = await gather(
+                http.get("foo", params={"include_roles": [1, 2]}),
+                http.get("foo", params={"include_roles": [1, 2], "a": None}),
+            )
+            await http.get("foo", params={"include_roles": [1, 2]})
+
+        assert [path for path, _, _ in handler.requests] == [
+            "/foo?include_roles=1&include_roles=2"
+        ]
+        assert responses[0] == responses[1]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller(self):
+        async with serve(make_handler(delay=0.05)) as http:
+            first = ensure_future(http.get("foo"))
+            second = ensure_future(http.get("foo"))
+
+            await sleep(0.01)
+            first.cancel()
+
+            assert (await second)["count"] == 2
+            assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        handler = make_handler({"status": 404}, delay=0.05)
+
+        async with serve(handler) as http:
+            results = await gather(
+                *(http.get("foo") for _ in range(3)),
+                return_exceptions=True
+            )
+
+        assert all(isinstance(result, NotFoundError) for result in results)
+        assert len({id(result) for result in results}) == 3
+
+    @pytest.mark.asyncio
+    async def test_closed_first_caller(self):
+        handler = make_handler(
+            {"headers": bucket_headers(remaining=0, reset_after=0.1)}
+        )
+
+        async with serve(handler) as http:
+            await http.get("foo")
+
+            # Closed while it waits for the rate limit to reset
+            closed = http.get("foo")
+            closed.send(None)
+            closed.close()
+
+            assert (await wait_for(http.get("foo"), timeout=1))["count"] == 2
+
+
+@pytest.mark.usefixtures("fast_backoff")
+class TestSend:
+
+    @pytest.mark.asyncio
+    async def test_retries_server_errors(self):
+        handler = make_handler({"status": 502}, {"status": 500}, {})
+
+        async with serve(handler) as http:
+            response = await http.post(
+                "foo", {"a": 1}, headers={"X-Audit-Log-Reason": "bar"}
+            )
+
+        assert response["count"] == 3
+        assert len(handler.requests) == 3
+
+        for _, headers, body in handler.requests:
+            assert headers["X-Audit-Log-Reason"] == "bar"
+            assert headers["Authorization"] == "Bot token"
+            assert loads(body) == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_params_kept_on_retries(self):
+        handler = make_handler({"status": 500}, {})
+
+        async with serve(handler) as http:
+            await http.get("foo", params={"limit": 5, "before": None})
+
+        assert [path for path, _, _ in handler.requests] == [
+            "/foo?limit=5", "/foo?limit=5"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_server_errors_exhaust_retries(self):
+        handler = make_handler({"status": 502})
+
+        async with serve(handler, ttl=3) as http:
+            with pytest.raises(ServerError):
+                await http.get("foo")
+
+        assert len(handler.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_backoff_is_bounded(self, sleeps):
+        async with serve(make_handler({"status": 502}), ttl=5) as http:
+            with pytest.raises(ServerError):
+                await http.get("foo")
+
+        # No sleep after the last attempt
+        assert len(sleeps) == 4
+        assert all(0.001 <= delay <= 0.01 for delay in sleeps)
+
+    @pytest.mark.asyncio
+    async def test_http_errors_raise_their_exception(self):
+        handler = make_handler({"status": 404, "reason": "Nope"})
+
+        async with serve(handler) as http:
+            with pytest.raises(NotFoundError, match="Nope"):
+                await http.get("foo")
+
+        assert len(handler.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after(self, sleeps):
+        handler = make_handler(
+            {"status": 429, "json": {"retry_after": 0.25}}, {}
+        )
+
+        async with serve(handler, ttl=1) as http:
+            assert (await http.get("foo"))["count"] == 2
+
+        assert sleeps == [0.25]
+
+    @pytest.mark.asyncio
+    async def test_semaphore_released(self):
+        # The bucket allows one request at a time, so a semaphore that
+        # isn't released blocks the next request.
+        handler = make_handler(
+            {"headers": bucket_headers()},
+            {"status": 500, "headers": bucket_headers()},
+            {"status": 404, "headers": bucket_headers()},
+            {"headers": bucket_headers()},
+        )
+
+        async with serve(handler) as http:
+            await wait_for(http.get("foo"), timeout=1)
+            with pytest.raises(NotFoundError):
+                await wait_for(http.get("foo"), timeout=1)
+
+            await wait_for(http.get("foo"), timeout=1)
+
+
+class TestSession:
+
+    def test_created_lazily(self):
+        # aiohttp can only create sessions inside a running event loop
+        http = HTTPClient("token")
+        run(http.close())
+
+    @pytest.mark.asyncio
+    async def test_external_session(self):
+        handler = make_handler()
+
+        async with ClientSession() as session:
+            async with serve(handler, session=session) as http:
+                await http.get("foo")
+                await http.post("foo", {}, headers={"X-Foo": "bar"})
+
+            assert not session.closed
+
+        for _, headers, _ in handler.requests:
+            assert headers["Authorization"] == "Bot token"
+            assert headers["User-Agent"].startswith("DiscordBot")
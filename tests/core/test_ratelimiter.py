@@ -0,0 +1,62 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from asyncio import wait_for
+
+import pytest
+
+from pincer.core.ratelimiter import RateLimiter
+from tests._utils import bucket_headers
+
+
+class TestRateLimiter:
+
+    @pytest.mark.asyncio
+    async def test_unknown_endpoint(self):
+        limiter = RateLimiter()
+        assert await limiter.wait_until_not_ratelimited("foo", "GET") is None
+
+    @pytest.mark.asyncio
+    async def test_semaphore_limits_in_flight_requests(self):
+        limiter = RateLimiter()
+        limiter.save_response_bucket("foo", "GET", bucket_headers(limit=2))
+
+        first = await limiter.wait_until_not_ratelimited("foo", "GET")
+        second = await limiter.wait_until_not_ratelimited("foo", "GET")
+
+        assert first is second
+        assert first.locked()
+
+        first.release()
+        assert not first.locked()
+
+    def test_semaphore_kept_while_limit_is_unchanged(self):
+        limiter = RateLimiter()
+        limiter.save_response_bucket("foo", "GET", bucket_headers(limit=2))
+        semaphore = limiter.semaphores["foo", "GET"]
+
+        limiter.save_response_bucket(
+            "foo", "GET", bucket_headers(limit=2, remaining=1)
+        )
+        assert limiter.semaphores["foo", "GET"] is semaphore
+
+        limiter.save_response_bucket("foo", "GET", bucket_headers(limit=5))
+        assert limiter.semaphores["foo", "GET"] is not semaphore
+
+    @pytest.mark.asyncio
+    async def test_endpoints_sharing_a_bucket_dont_block_each_other(self):
+        limiter = RateLimiter()
+        headers = bucket_headers(limit=1)
+        limiter.save_response_bucket("channels/1/messages", "POST", headers)
+        limiter.save_response_bucket("channels/2/messages", "POST", headers)
+
+        first = await limiter.wait_until_not_ratelimited(
+            "channels/1/messages", "POST"
+        )
+        second = await wait_for(
+            limiter.wait_until_not_ratelimited("channels/2/messages", "POST"),
+            timeout=1
+        )
+
+        assert first is not second
+        assert first.locked() and second.locked()
@@ -0,0 +1,41 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import sys
+
+import pytest
+
+from pincer.objects import Channel, TextChannel
+
+FAKE_CHANNEL = {
+    'id': '1',
+    'type': 0,
+    'name': 'general',
+    'position': 0,
+    'guild_id': '2',
+    'permission_overwrites': [],
+    'nsfw': False
+}
+
+
+class TestChannel:
+
+    @staticmethod
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10),
+        reason="dataclass slots require Python 3.10"
+    )
+    def test_slots():
+        channel = Channel.from_dict(FAKE_CHANNEL)
+        text_channel = TextChannel.from_dict(FAKE_CHANNEL)
+
+        assert not hasattr(channel, "__dict__")
+        assert not hasattr(text_channel, "__dict__")
+        assert repr(channel) == "Channel(id=1, guild_id=2, name='general')"
+
+    @staticmethod
+    def test_hash():
+        channel = Channel.from_dict(FAKE_CHANNEL)
+
+        assert hash(channel) == hash(channel.id)
+        assert {channel, Channel.from_dict(FAKE_CHANNEL)} == {channel}
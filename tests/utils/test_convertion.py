@@ -1,7 +1,9 @@
 # Copyright Pincer 2021-Present
 # Full MIT License can be found in `LICENSE` at the project root.
 
-from pincer.utils.conversion import remove_none
+from json import loads
+
+from pincer.utils.conversion import json_dumps, remove_none
 
 
 class TestSnowflake:
@@ -10,3 +12,9 @@ class TestSnowflake:
         assert remove_none([None, 1]) == [1]
         assert remove_none({None, 1}) == {1}
         assert remove_none({'a': 1, 'b': None}) == {'a': 1}
+
+    def test_json_dumps(self):
+        encoded = json_dumps({'a': [1, None], 'b': 'é'})
+
+        assert isinstance(encoded, bytes)
+        assert loads(encoded) == {'a': [1, None], 'b': 'é'}